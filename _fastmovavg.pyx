@@ -0,0 +1,70 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""_fastmovavg.pyx
+C implementations of the batch moving-average loops (single symbol).
+
+Build in place with:  python setup.py build_ext --inplace
+strategies.py uses these when the extension is importable and falls back to the
+numba/numpy paths otherwise. Both functions write int8 signals into `out`
+(1 = BUY, -1 = SELL, 0 = none) and follow the per-tick strategies' update order,
+so results match them exactly.
+"""
+
+cimport cython
+
+
+def windowed_signals(const double[::1] prices, Py_ssize_t k, signed char[::1] out):
+    """Sliding-window average signals. Time O(n), space O(k) working state."""
+    cdef Py_ssize_t n = prices.shape[0]
+    cdef Py_ssize_t i
+    cdef Py_ssize_t head = 0
+    cdef Py_ssize_t count = 0
+    cdef double running_sum = 0.0
+    cdef double price, avg
+    cdef double[::1] ring
+
+    if k <= 0:
+        raise ValueError("k must be positive")
+    if out.shape[0] < n:
+        raise ValueError("out is shorter than prices")
+    ring = cython.view.array(shape=(k,), itemsize=sizeof(double), format="d")
+
+    for i in range(n):
+        price = prices[i]
+        if count == k:
+            running_sum -= ring[head]
+        else:
+            count += 1
+        ring[head] = price
+        head += 1
+        if head == k:
+            head = 0
+        running_sum += price
+        avg = running_sum / count
+        if price > avg:
+            out[i] = 1
+        elif price < avg:
+            out[i] = -1
+        else:
+            out[i] = 0
+
+
+def cumulative_signals(const double[::1] prices, signed char[::1] out):
+    """Cumulative (all-history) average signals. Time O(n), space O(1) working state."""
+    cdef Py_ssize_t n = prices.shape[0]
+    cdef Py_ssize_t i
+    cdef double running_sum = 0.0
+    cdef double price, avg
+
+    if out.shape[0] < n:
+        raise ValueError("out is shorter than prices")
+
+    for i in range(n):
+        price = prices[i]
+        running_sum += price
+        avg = running_sum / (i + 1)
+        if price > avg:
+            out[i] = 1
+        elif price < avg:
+            out[i] = -1
+        else:
+            out[i] = 0
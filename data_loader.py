@@ -1,81 +1,310 @@
 """data_loader.py
-CSV parsing and MarketDataPoint creation using the built-in csv module.
+CSV parsing and MarketDataPoint creation.
+
+Bulk loads go through pandas.read_csv (C tokenizer, typed columns); the streaming
+reader memory-maps the file and splits rows by hand so it never holds all ticks.
 
 Assumptions:
 - CSV columns: timestamp, symbol, price
 - timestamp is ISO-8601 (preferred) or '%Y-%m-%d %H:%M:%S'
+
+Optional dependency: if `ciso8601` is installed, ISO-8601 timestamps are parsed with
+its C parser (several times faster than datetime.fromisoformat, with cached tz objects);
+otherwise the stdlib parser is used. Both give the same datetimes for everything the stdlib
+accepts, but ciso8601 is more permissive: reduced-precision dates ('2026-01'), ordinal dates
+('2026-001') and '24:00' midnight ('2026-01-01T24:00:00') load with it and raise without it.
 """
 
 from __future__ import annotations
 
-import csv
+import mmap
+import os
+import sys
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List, Optional, Union
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from models import MarketDataArrays, MarketDataPoint
+
+_STREAM_TS_CACHE_SIZE = 1 << 16
+_SYM_CACHE_SIZE = 1 << 12
+
+# Raw symbol field -> interned, stripped str. Symbols come from a tiny set, so every
+# tick of one symbol shares a single str object (and dict lookups hit the identity check).
+# Cleared when full, like the timestamp cache; sys.intern keeps identities stable across clears.
+_sym_cache: Dict[bytes, str] = {}
+
+try:
+    # Optional C parser (see module docstring); raises ValueError like fromisoformat,
+    # though it accepts a few extra ISO-8601 forms.
+    from ciso8601 import parse_datetime as _iso
+except ImportError:
+    if sys.version_info >= (3, 11):
+        # 3.11+ fromisoformat accepts a trailing 'Z' natively.
+        _iso = datetime.fromisoformat
+    else:
+        def _iso(raw: str) -> datetime:
+            # Only allocate the replaced string when there is a 'Z' to replace.
+            if raw.endswith("Z"):
+                return datetime.fromisoformat(raw[:-1] + "+00:00")
+            return datetime.fromisoformat(raw)
 
-from models import MarketDataPoint
 
+def _strptime_parser(fmt: str) -> Callable[[str], datetime]:
+    def parse(raw: str) -> datetime:
+        return datetime.strptime(raw, fmt)
+    return parse
 
+
+# Candidates in preference order: ISO-8601 first, then common fallback formats.
+_PARSERS: Tuple[Callable[[str], datetime], ...] = (
+    _iso,
+    _strptime_parser("%Y-%m-%d %H:%M:%S"),
+    _strptime_parser("%Y/%m/%d %H:%M:%S"),
+)
+# Last parser that succeeded; a file almost always sticks to one format, so try it first.
+_last_parser: Callable[[str], datetime] = _iso
+
+
+@lru_cache(maxsize=1 << 16)
 def _parse_timestamp(raw: str) -> datetime:
+    # Memoized on the raw string: intraday feeds repeat the same timestamp across symbols.
+    global _last_parser
     raw = raw.strip()
-    # Fast path: ISO-8601 (e.g., '2026-01-20T15:04:05' or with timezone offset)
+    # Fastest path: 'YYYY-MM-DD HH:MM:SS' sliced straight into datetime(), no format parsing
+    # (or '/' date separators); separators and ASCII digits are checked before slicing.
+    if (
+        len(raw) == 19 and raw[10] == " " and raw[4] in "-/" and raw[7] == raw[4]
+        and raw[13] == raw[16] == ":"
+    ):
+        digits = raw[0:4] + raw[5:7] + raw[8:10] + raw[11:13] + raw[14:16] + raw[17:19]
+        if digits.isascii() and digits.isdigit():
+            try:
+                return datetime(
+                    int(digits[0:4]), int(digits[4:6]), int(digits[6:8]),
+                    int(digits[8:10]), int(digits[10:12]), int(digits[12:14]),
+                )
+            except ValueError:
+                pass
+
+    # Adaptive path: whichever parser handled the previous timestamp (ISO-8601 initially)
     try:
-        return datetime.fromisoformat(raw.replace("Z", "+00:00"))
+        return _last_parser(raw)
     except ValueError:
         pass
 
-    # Fallback: common timestamp format
-    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y/%m/%d %H:%M:%S"):
+    # Format changed (or first miss): try the remaining candidates and remember the winner
+    for parser in _PARSERS:
+        if parser is _last_parser:
+            continue
         try:
-            return datetime.strptime(raw, fmt)
+            ts = parser(raw)
         except ValueError:
             continue
+        _last_parser = parser
+        return ts
 
     raise ValueError(f"Unsupported timestamp format: {raw!r}")
 
 
+# Strict formats pandas parses fully vectorized; anything else goes through _parse_timestamp.
+_FRAME_TS_FORMATS = ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S")
+
+
+def _parse_timestamp_column(raw: pd.Series) -> pd.Series:
+    raw = raw.str.strip()
+    for fmt in _FRAME_TS_FORMATS:
+        try:
+            parsed = pd.to_datetime(raw, format=fmt)
+        except (ValueError, TypeError):
+            continue
+        # pandas maps '' to NaT; leave those to _parse_timestamp, which rejects them.
+        if not parsed.isna().any():
+            return parsed
+
+    # Offsets, fractional seconds, slashes, mixed formats: same contract as the streaming
+    # reader (raises ValueError on unsupported strings). _parse_timestamp is memoized.
+    parsed = raw.map(_parse_timestamp)
+    try:
+        return pd.to_datetime(parsed)
+    except (ValueError, TypeError):
+        # Mixed UTC offsets have no single datetime64 dtype; keep the per-value datetimes.
+        return parsed.astype(object)
+
+
+def load_market_data_df(csv_path: Union[str, Path]) -> pd.DataFrame:
+    """Load all rows into a DataFrame with typed columns.
+
+    Columns: timestamp (datetime64, or object datetimes if UTC offsets are mixed),
+    symbol (category), price (float64).
+    Parsing happens in pandas' C tokenizer, so no Python object is built per row
+    for the common ISO/'%Y-%m-%d %H:%M:%S' timestamps.
+
+    Time complexity: O(n) to read and parse n rows.
+    Space complexity: O(n), but as three dense columns rather than n Python objects.
+    """
+    csv_path = Path(csv_path)
+    required = {"timestamp", "symbol", "price"}
+    try:
+        columns = list(pd.read_csv(csv_path, nrows=0).columns)
+    except pd.errors.EmptyDataError:
+        columns = []
+    if not required.issubset(columns):
+        raise ValueError(f"CSV must contain columns {sorted(required)}; got {columns}")
+
+    df = pd.read_csv(
+        csv_path,
+        usecols=["timestamp", "symbol", "price"],
+        dtype={"timestamp": str, "symbol": "category", "price": "float64"},
+        na_filter=False,  # 'NA'/'null'/'' are data, not missing values (as in the csv reader)
+    )
+    df["timestamp"] = _parse_timestamp_column(df["timestamp"])
+    df["symbol"] = df["symbol"].str.strip().astype("category")
+    return df[["timestamp", "symbol", "price"]]
+
+
+def _to_pydatetimes(timestamps: pd.Series) -> List[datetime]:
+    if pd.api.types.is_datetime64_any_dtype(timestamps):
+        return timestamps.dt.to_pydatetime().tolist()
+    return timestamps.tolist()
+
+
+def frame_to_points(df: pd.DataFrame) -> List[MarketDataPoint]:
+    """Materialize MarketDataPoint objects from a frame built by load_market_data_df.
+
+    Time complexity: O(n)
+    Space complexity: O(n) immutable MarketDataPoint objects.
+    """
+    timestamps = _to_pydatetimes(df["timestamp"])
+    return [
+        MarketDataPoint(timestamp=ts, symbol=sym, price=price)
+        for ts, sym, price in zip(timestamps, df["symbol"].tolist(), df["price"].tolist())
+    ]
+
+
+def frame_to_arrays(df: pd.DataFrame) -> MarketDataArrays:
+    """Wrap the columns of a frame built by load_market_data_df without copying per tick.
+
+    Time complexity: O(n) (column conversions only, no Python object per row).
+    Space complexity: O(n) in dense numpy arrays.
+    """
+    symbol = df["symbol"].cat
+    symbol_codes = symbol.codes.to_numpy()
+    if (symbol_codes < 0).any():
+        # Code -1 marks a missing category; indexing symbols with it would mislabel the row.
+        raise ValueError("symbol column contains missing values")
+    ts = df["timestamp"]
+    if pd.api.types.is_datetime64_dtype(ts):
+        timestamps = ts.to_numpy()
+    else:
+        # tz-aware (or mixed-offset) data: keep real datetimes so the offsets survive.
+        timestamps = np.asarray(_to_pydatetimes(ts), dtype=object)
+    return MarketDataArrays(
+        timestamps=timestamps,
+        symbol_codes=symbol_codes,
+        symbols=np.asarray([sys.intern(sym) for sym in symbol.categories.tolist()], dtype=object),
+        prices=df["price"].to_numpy(dtype=np.float64),
+    )
+
+
+def load_market_data_arrays(csv_path: Union[str, Path]) -> MarketDataArrays:
+    """Load all rows as a struct-of-arrays (see MarketDataArrays).
+
+    Time complexity: O(n)
+    Space complexity: O(n), dense.
+    """
+    return frame_to_arrays(load_market_data_df(csv_path))
+
+
 def load_market_data(csv_path: Union[str, Path]) -> List[MarketDataPoint]:
     """Load all rows into memory as a list of MarketDataPoint.
 
+    Thin wrapper over load_market_data_df kept for callers that want tick objects.
+
     Time complexity: O(n) to read and parse n rows.
     Space complexity: O(n) to store n immutable MarketDataPoint objects in a list.
     """
-    csv_path = Path(csv_path)
-    data: List[MarketDataPoint] = []
+    return frame_to_points(load_market_data_df(csv_path))
 
-    with csv_path.open("r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        required = {"timestamp", "symbol", "price"}
-        if not required.issubset(set(reader.fieldnames or [])):
-            raise ValueError(f"CSV must contain columns {sorted(required)}; got {reader.fieldnames}")
 
-        for row in reader:
-            ts = _parse_timestamp(row["timestamp"])
-            sym = row["symbol"].strip()
-            price = float(row["price"])
-            data.append(MarketDataPoint(timestamp=ts, symbol=sym, price=price))
+def open_fast(csv_path: Union[str, Path]) -> mmap.mmap:
+    """Map a file read-only for a single sequential pass, with kernel read-ahead hints.
 
-    return data
+    On Linux this sets POSIX_FADV_SEQUENTIAL on the descriptor (larger read-ahead window)
+    and MADV_SEQUENTIAL | MADV_WILLNEED on the mapping (prefetch, drop pages behind us),
+    which mostly helps cold-cache reads of large files. Where the hints are unavailable
+    it is a plain read-only mmap. The file must not be empty (mmap rejects that).
+    """
+    fd = os.open(Path(csv_path), os.O_RDONLY)
+    try:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)  # the mapping stays valid without the descriptor
+    if hasattr(mm, "madvise"):
+        for advice in ("MADV_SEQUENTIAL", "MADV_WILLNEED"):
+            if hasattr(mmap, advice):
+                mm.madvise(getattr(mmap, advice))
+    return mm
+
+
+def _open_mapped(csv_path: Path) -> mmap.mmap:
+    with csv_path.open("rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
 
 
-def stream_market_data(csv_path: Union[str, Path]) -> Iterable[MarketDataPoint]:
+def stream_market_data(csv_path: Union[str, Path], fast_io: bool = False) -> Iterable[MarketDataPoint]:
     """Yield MarketDataPoint rows one-by-one (streaming).
 
+    The file is memory-mapped and split on newlines and commas directly: one list of
+    byte fields per row instead of a csv.DictReader dict. Quoted fields are not supported
+    (the schema is three plain columns). fast_io=True maps it via open_fast (sequential
+    read-ahead hints, useful for large cold files; a no-op where unsupported).
+
     Time complexity: O(n)
-    Space complexity: O(1) extra space (excluding the file handle), since we don't store all ticks.
+    Space complexity: O(1) extra space (excluding the mapping), since we don't store all ticks;
+    the timestamp and symbol caches are capped at _STREAM_TS_CACHE_SIZE and _SYM_CACHE_SIZE entries.
     """
     csv_path = Path(csv_path)
-    with csv_path.open("r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        required = {"timestamp", "symbol", "price"}
-        if not required.issubset(set(reader.fieldnames or [])):
-            raise ValueError(f"CSV must contain columns {sorted(required)}; got {reader.fieldnames}")
-
-        for row in reader:
-            ts = _parse_timestamp(row["timestamp"])
-            sym = row["symbol"].strip()
-            price = float(row["price"])
+    required = {"timestamp", "symbol", "price"}
+    if csv_path.stat().st_size == 0:
+        raise ValueError(f"CSV must contain columns {sorted(required)}; got []")
+    with open_fast(csv_path) if fast_io else _open_mapped(csv_path) as mm:
+        header = mm.readline().decode("utf-8").rstrip("\r\n").split(",")
+        if not required.issubset(header):
+            raise ValueError(f"CSV must contain columns {sorted(required)}; got {header}")
+        ts_idx = header.index("timestamp")
+        sym_idx = header.index("symbol")
+        price_idx = header.index("price")
+
+        # Per-generator cache (dropped when the stream closes) rather than the global LRU,
+        # keyed on the raw bytes so cache hits skip decoding too.
+        parse = _parse_timestamp.__wrapped__
+        ts_cache: Dict[bytes, datetime] = {}
+        for line in iter(mm.readline, b""):
+            line = line.rstrip(b"\r\n")
+            if not line:
+                continue
+            fields = line.split(b",")
+            ts_b = fields[ts_idx]
+            ts = ts_cache.get(ts_b)
+            if ts is None:
+                if len(ts_cache) >= _STREAM_TS_CACHE_SIZE:
+                    ts_cache.clear()  # keep the stream O(1) in memory
+                ts = ts_cache[ts_b] = parse(ts_b.decode("utf-8"))
+            sym_b = fields[sym_idx]
+            sym = _sym_cache.get(sym_b)
+            if sym is None:
+                if len(_sym_cache) >= _SYM_CACHE_SIZE:
+                    _sym_cache.clear()
+                sym = _sym_cache[sym_b] = sys.intern(sym_b.decode("utf-8").strip())
+            price = float(fields[price_idx])  # float() accepts bytes
             yield MarketDataPoint(timestamp=ts, symbol=sym, price=price)
 
 
@@ -89,26 +318,30 @@ def generate_synthetic_csv(
 ) -> Path:
     """Utility for local testing if market_data.csv isn't provided.
 
-    Creates a simple random-walk price series.
+    Creates a simple random-walk price series of 1-minute ticks. The walk, the
+    timestamps and the CSV writing are all vectorized (numpy/pandas), no per-row Python.
     """
-    import random
-
     out_path = Path(out_path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    rng = random.Random(seed)
+    rng = np.random.default_rng(seed)
 
     if start is None:
         start = datetime(2026, 1, 1, 9, 30, 0)
 
-    price = start_price
-    with out_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["timestamp", "symbol", "price"])
-        for i in range(n):
-            # 1-minute ticks
-            ts = start + timedelta(minutes=i)
-            # random walk with small drift
-            price += rng.uniform(-0.5, 0.5)
-            writer.writerow([ts.isoformat(), symbol, f"{price:.4f}"])
+    # random walk with small drift
+    prices = start_price + np.cumsum(rng.uniform(-0.5, 0.5, n))
+    timestamps = pd.date_range(start, periods=n, freq="1min")
+    # Match datetime.isoformat(): microseconds only when start has them (every tick
+    # shares start's sub-second part), and '+HH:MM' offsets.
+    has_us = start.microsecond != 0
+    if start.tzinfo is None:
+        # ISO-8601 strings straight from numpy (C), ~10x cheaper than a strftime date_format
+        ts_col = np.datetime_as_string(timestamps.to_numpy(), unit="us" if has_us else "s")
+    else:
+        ts_col = pd.Series(timestamps.strftime("%Y-%m-%dT%H:%M:%S.%f%z" if has_us else "%Y-%m-%dT%H:%M:%S%z"))
+        ts_col = ts_col.str[:-2] + ":" + ts_col.str[-2:]
+    pd.DataFrame({"timestamp": ts_col, "symbol": symbol, "price": prices}).to_csv(
+        out_path, index=False, float_format="%.4f", lineterminator="\r\n"
+    )
 
     return out_path
@@ -12,7 +12,7 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-from data_loader import generate_synthetic_csv, load_market_data
+from data_loader import generate_synthetic_csv, load_market_data_arrays
 from profiler import benchmark_strategies
 from reporting import make_plots, write_report
 from strategies import NaiveMovingAverageStrategy, OptimizedNaiveMovingAverageStrategy, WindowedMovingAverageStrategy
@@ -33,7 +33,8 @@ def main():
         csv_path = out_dir / "market_data_synthetic.csv"
         generate_synthetic_csv(csv_path, n=100_000)
 
-    ticks = load_market_data(csv_path)
+    # Struct-of-arrays: batch-capable strategies get numpy arrays directly.
+    ticks = load_market_data_arrays(csv_path)
 
     sizes = [1_000, 10_000, 100_000]
     sizes = [s for s in sizes if s <= len(ticks)]
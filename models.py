@@ -7,20 +7,73 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List
+from typing import Iterator, List, Union
 
+import numpy as np
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class MarketDataPoint:
     """Immutable tick (timestamp, symbol, price).
 
     Space: O(1) per tick (but stored in a list becomes O(n) overall).
+    slots=True drops the per-instance __dict__, roughly halving each tick's footprint.
     """
     timestamp: datetime
     symbol: str
     price: float
 
 
+@dataclass(frozen=True, eq=False)
+class MarketDataArrays:
+    """Struct-of-arrays tick storage: one dense column per field instead of n objects.
+
+    - timestamps: naive datetime64 array, or an object array of datetime when the data
+      carries UTC offsets (datetime64 cannot hold them)
+    - symbol_codes: integer codes into `symbols`
+    - symbols: object array of distinct symbol strings
+    - prices: float64 array
+
+    Space: O(n) but ~10x smaller than a list of MarketDataPoint, and contiguous.
+    Slicing returns another MarketDataArrays; iterating materializes MarketDataPoint
+    objects one at a time so per-tick strategies still work.
+    """
+    timestamps: np.ndarray
+    symbol_codes: np.ndarray
+    symbols: np.ndarray
+    prices: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def __getitem__(self, idx: Union[int, slice]) -> Union["MarketDataArrays", MarketDataPoint]:
+        if isinstance(idx, slice):
+            return MarketDataArrays(
+                timestamps=self.timestamps[idx],
+                symbol_codes=self.symbol_codes[idx],
+                symbols=self.symbols,
+                prices=self.prices[idx],
+            )
+        ts = self.timestamps[idx]
+        return MarketDataPoint(
+            timestamp=ts.astype("datetime64[us]").item() if self.timestamps.dtype.kind == "M" else ts,
+            symbol=self.symbols[self.symbol_codes[idx]],
+            price=float(self.prices[idx]),
+        )
+
+    def __iter__(self) -> Iterator[MarketDataPoint]:
+        symbols = self.symbols.tolist()
+        if self.timestamps.dtype.kind == "M":
+            timestamps = self.timestamps.astype("datetime64[us]").tolist()
+        else:
+            timestamps = self.timestamps.tolist()
+        for ts, code, price in zip(timestamps, self.symbol_codes.tolist(), self.prices.tolist()):
+            yield MarketDataPoint(timestamp=ts, symbol=symbols[code], price=price)
+
+    def to_points(self) -> List[MarketDataPoint]:
+        return list(self)
+
+
 class Strategy(ABC):
     """Strategy interface for streaming signal generation."""
 
@@ -28,3 +81,8 @@ class Strategy(ABC):
     def generate_signals(self, tick: MarketDataPoint) -> List[str]:
         """Process one tick and return zero or more signals (e.g., ["BUY"], ["SELL"], [])."""
         raise NotImplementedError
+
+    # Strategies may additionally implement a vectorized batch path:
+    #   generate_signals_batch(symbol_codes, prices) -> np.ndarray[int8]
+    # returning 1 (BUY), -1 (SELL) or 0 (no signal) per tick, computed from a fresh state.
+    # profiler.run_strategy uses it whenever it is handed a MarketDataArrays.
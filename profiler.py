@@ -19,9 +19,13 @@ import time
 import tracemalloc
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Sequence
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 
-from models import MarketDataPoint, Strategy
+import numpy as np
+
+from models import MarketDataArrays, MarketDataPoint, Strategy
+
+Ticks = Union[Sequence[MarketDataPoint], MarketDataArrays]
 
 
 @dataclass
@@ -30,19 +34,58 @@ class BenchmarkResult:
     n_ticks: int
     seconds: Optional[float]          # None => TIMEOUT
     peak_memory_mb: Optional[float]   # None => not measured
+    path: str = "per-tick"            # "batch" => generate_signals_batch on struct-of-arrays input
+
+
+def run_strategy(strategy: Strategy, ticks: Ticks) -> int:
+    """Run a strategy over ticks, returning number of signals emitted.
 
+    Struct-of-arrays input goes through the strategy's vectorized generate_signals_batch
+    when it has one; otherwise ticks are fed one at a time to generate_signals.
+    """
+    if isinstance(ticks, MarketDataArrays):
+        batch = getattr(strategy, "generate_signals_batch", None)
+        if batch is not None:
+            return int(np.count_nonzero(batch(ticks.symbol_codes, ticks.prices)))
 
-def run_strategy(strategy: Strategy, ticks: Sequence[MarketDataPoint]) -> int:
-    """Run a strategy over ticks, returning number of signals emitted."""
     signal_count = 0
+    generate = strategy.generate_signals  # bind once, not per tick
     for t in ticks:
-        signal_count += len(strategy.generate_signals(t))
+        signal_count += len(generate(t))
     return signal_count
 
 
+def time_and_optionally_trace(
+    factory: Callable[[], Strategy],
+    ticks: Ticks,
+    repeats: int = 1,
+    time_limit_s: Optional[float] = None,
+    measure_memory: bool = True,
+    cprofile_path: Optional[Path] = None,
+) -> Tuple[Optional[float], Optional[float]]:
+    """Time a strategy, then optionally cProfile it and trace memory. Returns (seconds, peak_mb).
+
+    The clean runs are timed and the fastest kept. cProfile rides on the last of the
+    `repeats` runs, whose time is dropped since profiling skews it (with repeats=1 one
+    clean run is still timed first). tracemalloc gets its own run so the profiler's
+    allocations stay out of the peak: repeats + 1 executions when repeats > 1.
+
+    On TIMEOUT returns (None, None) and skips the instrumented runs (they would hang again).
+    """
+    clean_repeats = max(repeats - 1, 1) if cprofile_path is not None else repeats
+    secs = time_strategy(factory, ticks, repeats=clean_repeats, time_limit_s=time_limit_s)
+    if secs is None:
+        return None, None
+
+    if cprofile_path is not None:
+        profile_cprofile(factory, ticks, cprofile_path)
+    peak_mb = peak_memory_tracemalloc(factory, ticks) if measure_memory else None
+    return secs, peak_mb
+
+
 def time_strategy(
     factory: Callable[[], Strategy],
-    ticks: Sequence[MarketDataPoint],
+    ticks: Ticks,
     repeats: int = 1,
     time_limit_s: Optional[float] = None,
 ) -> Optional[float]:
@@ -63,7 +106,7 @@ def time_strategy(
     return best
 
 
-def peak_memory_tracemalloc(factory: Callable[[], Strategy], ticks: Sequence[MarketDataPoint]) -> float:
+def peak_memory_tracemalloc(factory: Callable[[], Strategy], ticks: Ticks) -> float:
     """Measure peak memory in MB using tracemalloc."""
     tracemalloc.start()
     strategy = factory()
@@ -73,14 +116,7 @@ def peak_memory_tracemalloc(factory: Callable[[], Strategy], ticks: Sequence[Mar
     return peak / (1024 * 1024)
 
 
-def profile_cprofile(factory: Callable[[], Strategy], ticks: Sequence[MarketDataPoint], out_path: Path) -> Path:
-    """Write cProfile stats to a text file for inspection."""
-    pr = cProfile.Profile()
-    pr.enable()
-    strategy = factory()
-    run_strategy(strategy, ticks)
-    pr.disable()
-
+def _write_cprofile_stats(pr: cProfile.Profile, out_path: Path) -> Path:
     s = io.StringIO()
     ps = pstats.Stats(pr, stream=s).sort_stats("cumulative")
     ps.print_stats(40)
@@ -90,8 +126,18 @@ def profile_cprofile(factory: Callable[[], Strategy], ticks: Sequence[MarketData
     return out_path
 
 
+def profile_cprofile(factory: Callable[[], Strategy], ticks: Ticks, out_path: Path) -> Path:
+    """Write cProfile stats to a text file for inspection."""
+    pr = cProfile.Profile()
+    pr.enable()
+    strategy = factory()
+    run_strategy(strategy, ticks)
+    pr.disable()
+    return _write_cprofile_stats(pr, out_path)
+
+
 def benchmark_strategies(
-    ticks: Sequence[MarketDataPoint],
+    ticks: Ticks,
     strategy_factories: Dict[str, Callable[[], Strategy]],
     repeats: int = 1,
     time_limit_s: Optional[float] = None,
@@ -99,16 +145,31 @@ def benchmark_strategies(
     measure_memory: bool = True,
 ) -> List[BenchmarkResult]:
     results: List[BenchmarkResult] = []
+    points: Optional[List[MarketDataPoint]] = None
     for name, factory in strategy_factories.items():
-        secs = time_strategy(factory, ticks, repeats=repeats, time_limit_s=time_limit_s)
-        peak_mb: Optional[float] = None
-        if measure_memory and secs is not None:
-            # Only measure memory if the run finished (otherwise we'd hang again).
-            peak_mb = peak_memory_tracemalloc(factory, ticks)
-
-        results.append(BenchmarkResult(strategy_name=name, n_ticks=len(ticks), seconds=secs, peak_memory_mb=peak_mb))
-
-        if cprofile_dir is not None and secs is not None:
-            profile_cprofile(factory, ticks, cprofile_dir / f"{name}_{len(ticks)}.txt")
+        run_ticks = ticks
+        path = "per-tick"
+        if isinstance(ticks, MarketDataArrays):
+            if hasattr(factory(), "generate_signals_batch"):
+                path = "batch"
+            else:
+                # Per-tick strategies: materialize once, outside the timed region.
+                if points is None:
+                    points = ticks.to_points()
+                run_ticks = points
+
+        cprofile_path = cprofile_dir / f"{name}_{len(ticks)}.txt" if cprofile_dir is not None else None
+        secs, peak_mb = time_and_optionally_trace(
+            factory,
+            run_ticks,
+            repeats=repeats,
+            time_limit_s=time_limit_s,
+            measure_memory=measure_memory,
+            cprofile_path=cprofile_path,
+        )
+
+        results.append(
+            BenchmarkResult(strategy_name=name, n_ticks=len(ticks), seconds=secs, peak_memory_mb=peak_mb, path=path)
+        )
 
     return results
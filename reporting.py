@@ -1,5 +1,8 @@
 """reporting.py
 Plot generation and markdown report creation.
+
+Plots use matplotlib's Figure API (saved through the Agg renderer) rather than pyplot:
+no GUI backend is initialised and no global figure state is kept.
 """
 
 from __future__ import annotations
@@ -7,7 +10,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import List, Optional
 
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 
 from profiler import BenchmarkResult
 
@@ -26,38 +29,38 @@ def make_plots(results: List[BenchmarkResult], out_dir: Path) -> dict:
     by = _group_by_strategy(results)
 
     # Runtime plot (skip TIMEOUTs)
-    plt.figure()
+    fig = Figure()
+    ax = fig.add_subplot()
     for name, rs in by.items():
         xs = [r.n_ticks for r in rs if r.seconds is not None]
         ys = [r.seconds for r in rs if r.seconds is not None]
         if xs:
-            plt.plot(xs, ys, marker="o", label=name)
-    plt.xscale("log")
-    plt.yscale("log")
-    plt.xlabel("Input size (ticks, log scale)")
-    plt.ylabel("Runtime (seconds, log scale)")
-    plt.title("Runtime Scaling by Strategy (TIMEOUTs omitted)")
-    plt.legend()
+            ax.plot(xs, ys, marker="o", label=name)
+    ax.set_xscale("log")
+    ax.set_yscale("log")
+    ax.set_xlabel("Input size (ticks, log scale)")
+    ax.set_ylabel("Runtime (seconds, log scale)")
+    ax.set_title("Runtime Scaling by Strategy (TIMEOUTs omitted)")
+    ax.legend()
     runtime_path = out_dir / "runtime_vs_input.png"
-    plt.savefig(runtime_path, bbox_inches="tight")
-    plt.close()
+    fig.savefig(runtime_path, bbox_inches="tight")
 
     # Memory plot (skip missing)
-    plt.figure()
+    fig = Figure()
+    ax = fig.add_subplot()
     for name, rs in by.items():
         xs = [r.n_ticks for r in rs if r.peak_memory_mb is not None]
         ys = [r.peak_memory_mb for r in rs if r.peak_memory_mb is not None]
         if xs:
-            plt.plot(xs, ys, marker="o", label=name)
-    plt.xscale("log")
-    plt.yscale("log")
-    plt.xlabel("Input size (ticks, log scale)")
-    plt.ylabel("Peak memory (MB, log scale)")
-    plt.title("Memory Scaling by Strategy (tracemalloc peak)")
-    plt.legend()
+            ax.plot(xs, ys, marker="o", label=name)
+    ax.set_xscale("log")
+    ax.set_yscale("log")
+    ax.set_xlabel("Input size (ticks, log scale)")
+    ax.set_ylabel("Peak memory (MB, log scale)")
+    ax.set_title("Memory Scaling by Strategy (tracemalloc peak)")
+    ax.legend()
     mem_path = out_dir / "memory_vs_input.png"
-    plt.savefig(mem_path, bbox_inches="tight")
-    plt.close()
+    fig.savefig(mem_path, bbox_inches="tight")
 
     return {"runtime_plot": runtime_path, "memory_plot": mem_path}
 
@@ -82,16 +85,20 @@ def write_report(
 ) -> Path:
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    header = "| Strategy | # Ticks | Runtime (s) | Peak Memory (MB) |\n|---|---:|---:|---:|\n"
+    header = "| Strategy | Path | # Ticks | Runtime (s) | Peak Memory (MB) |\n|---|---|---:|---:|---:|\n"
     lines = []
-    for r in sorted(results, key=lambda x: (x.strategy_name, x.n_ticks)):
-        lines.append(f"| {r.strategy_name} | {r.n_ticks:,} | {_fmt(r.seconds)} | {_fmt_mb(r.peak_memory_mb)} |")
+    # _group_by_strategy already orders each group by n_ticks; only the names need sorting.
+    by = _group_by_strategy(results)
+    for name in sorted(by):
+        for r in by[name]:
+            n_ticks, secs, peak = f"{r.n_ticks:,}", _fmt(r.seconds), _fmt_mb(r.peak_memory_mb)
+            lines.append(f"| {name} | {r.path} | {n_ticks} | {secs} | {peak} |")
     table = header + "\n".join(lines) + "\n"
 
     md = f"""# Runtime & Space Complexity in Financial Signal Processing
 
 ## What was implemented
-- **MarketDataPoint**: frozen dataclass (immutable tick object)
+- **MarketDataPoint**: frozen, slotted dataclass (immutable tick object, no per-instance `__dict__`)
 - **Strategies**:
   - **NaiveMovingAverageStrategy**: rescans history to compute average each tick
   - **WindowedMovingAverageStrategy**: deque + running sum for sliding window
@@ -100,20 +107,25 @@ def write_report(
 ## Complexity annotations (theoretical)
 ### Data ingestion
 - `load_market_data`: **Time O(n)**, **Space O(n)** (stores all ticks in a list)
+- `load_market_data_arrays`: **Time O(n)**, **Space O(n)** in dense numpy columns (struct-of-arrays)
 
 ### NaiveMovingAverageStrategy
-- Per tick: `sum(history)` => **Time O(n)**, `history` list => **Space O(n)**
+- Per tick: `cumsum(history[:n])[-1] / n` (sequential numpy reduction) => **Time O(n)**, `history` slab => **Space O(n)**
 - Over n ticks total: **Time O(n^2)**
 
 ### WindowedMovingAverageStrategy (window size k)
-- Per tick: constant deque ops + arithmetic => **Time O(1)**
-- Buffer size bounded by k => **Space O(k)**
+- Per-tick path: constant deque ops + arithmetic => **Time O(1)**; buffer bounded by k => **Space O(k)**
+- Batch path (struct-of-arrays input): one sliding-window kernel pass per symbol (numba/Cython when available) => **Time O(n)** total, plus O(n log n) for the stable argsort that groups several symbols; **Space O(n)** for the grouping indices and the int8 signal array (window state is still O(k))
 
 ### OptimizedNaiveMovingAverageStrategy
-- Per tick: update sum & count => **Time O(1)**
-- No history retained => **Space O(1)**
+- Per-tick path: update sum & count => **Time O(1)**; no history retained => **Space O(1)**
+- Batch path (struct-of-arrays input): `cumsum / arange` in numpy => **Time O(n)** total with no per-tick Python work, **Space O(n)** temporaries plus the int8 signal array
 
 ## Benchmark results
+The **Path** column says which execution model each row measures: `batch` rows call
+`generate_signals_batch` once on the struct-of-arrays columns and return all n signals, so their
+memory grows with n; `per-tick` rows feed `MarketDataPoint` objects to `generate_signals` one at a time.
+
 {table}
 
 ## Scaling plots
@@ -124,9 +136,9 @@ def write_report(
 ![Memory vs input]({plots['memory_plot'].name})
 
 ## Narrative comparison
-- The **naive strategy** grows superlinearly because every tick rescans a longer history list; at 100k ticks it can exceed practical runtime limits (**TIMEOUT** in the table if capped).
-- The **windowed strategy** stays stable per tick because it does constant work and stores only the last **k** prices.
-- The **optimized naive strategy** demonstrates how replacing repeated scans with **incremental state** can cut both time and memory, at the cost of changing from a windowed average to a cumulative average.
+- The **naive strategy** grows superlinearly because every tick rescans a longer history buffer; at 100k ticks it can still exceed practical runtime limits (**TIMEOUT** in the table if capped).
+- The **windowed strategy** stays stable per tick because it does constant work and its window state holds only the last **k** prices; when benchmarked on the batch path, its peak memory still grows with n because of the O(n) signal array.
+- The **optimized naive strategy** demonstrates how replacing repeated scans with **incremental state** cuts the time to O(1) per tick (O(1) space on the per-tick path), at the cost of changing from a windowed average to a cumulative average. Its batch rows trade that O(1) space for O(n) numpy temporaries to avoid per-tick Python work entirely.
 
 ## Profiling notes
 See `profiles/` for cProfile output (top cumulative-time functions). TIMEOUT runs are not profiled.
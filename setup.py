@@ -0,0 +1,13 @@
+"""setup.py
+Builds the optional _fastmovavg C extension (requires Cython):
+
+    python setup.py build_ext --inplace
+"""
+
+from Cython.Build import cythonize
+from setuptools import setup
+
+setup(
+    name="financial-signal-processing",
+    ext_modules=cythonize("_fastmovavg.pyx"),
+)
@@ -0,0 +1,56 @@
+"""strategies_numba.py
+Compiled per-tick kernels for the batch (struct-of-arrays) strategy path.
+
+Kernels are JIT-compiled with numba when it is installed; otherwise the same
+loops run as plain Python so results never depend on the optional dependency.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True)
+def windowed_signals(prices, k):
+    """Sliding-window average signals for one symbol's prices.
+
+    Mirrors WindowedMovingAverageStrategy.generate_signals tick by tick: a ring
+    buffer of the last k prices plus a running sum, same update order.
+    Returns int8 signals (1 = BUY, -1 = SELL, 0 = none).
+    - Time: O(n)
+    - Space: O(k) working state + O(n) output
+    """
+    n = prices.shape[0]
+    out = np.zeros(n, dtype=np.int8)
+    ring = np.empty(k, dtype=np.float64)
+    head = 0
+    count = 0
+    running_sum = 0.0
+    for i in range(n):
+        price = prices[i]
+        if count == k:
+            running_sum -= ring[head]
+        else:
+            count += 1
+        ring[head] = price
+        head += 1
+        if head == k:
+            head = 0
+        running_sum += price
+        avg = running_sum / count
+        if price > avg:
+            out[i] = 1
+        elif price < avg:
+            out[i] = -1
+    return out
@@ -0,0 +1,180 @@
+from datetime import datetime
+
+import pytest
+
+from data_loader import (
+    _parse_timestamp,
+    generate_synthetic_csv,
+    load_market_data,
+    load_market_data_arrays,
+    load_market_data_df,
+    stream_market_data,
+)
+
+
+def test_df_loader_matches_points(tmp_path):
+    csv_path = generate_synthetic_csv(tmp_path / "ticks.csv", n=50)
+    df = load_market_data_df(csv_path)
+    points = load_market_data(csv_path)
+
+    assert list(df.columns) == ["timestamp", "symbol", "price"]
+    assert str(df["symbol"].dtype) == "category"
+    assert df["price"].dtype == "float64"
+    assert len(points) == len(df) == 50
+    assert points[0].timestamp == datetime(2026, 1, 1, 9, 30, 0)
+    assert [p.price for p in points] == df["price"].tolist()
+
+
+def test_df_loader_falls_back_for_slash_timestamps(tmp_path):
+    csv_path = tmp_path / "ticks.csv"
+    csv_path.write_text("timestamp,symbol,price\n2026/01/01 09:30:00, ABC ,1.5\n", encoding="utf-8")
+    (point,) = load_market_data(csv_path)
+    assert point.timestamp == datetime(2026, 1, 1, 9, 30, 0)
+    assert point.symbol == "ABC"
+
+
+def test_parse_timestamp_formats():
+    expected = datetime(2026, 1, 1, 9, 30, 0)
+    for raw in ("2026-01-01T09:30:00", "2026-01-01 09:30:00", " 2026/01/01 09:30:00 "):
+        assert _parse_timestamp(raw) == expected
+    assert _parse_timestamp("2026-01-01T09:30:00Z").utcoffset().total_seconds() == 0
+
+
+def test_stream_matches_load(tmp_path):
+    csv_path = generate_synthetic_csv(tmp_path / "ticks.csv", n=50)
+    assert list(stream_market_data(csv_path)) == load_market_data(csv_path)
+
+
+def test_stream_handles_column_order_and_crlf(tmp_path):
+    csv_path = tmp_path / "ticks.csv"
+    csv_path.write_bytes(b"price,timestamp,symbol\r\n1.5,2026-01-01T09:30:00,ABC\r\n\r\n2,2026-01-01T09:31:00,XYZ\r\n")
+    points = list(stream_market_data(csv_path))
+    assert [(p.symbol, p.price) for p in points] == [("ABC", 1.5), ("XYZ", 2.0)]
+    assert points[1].timestamp == datetime(2026, 1, 1, 9, 31, 0)
+
+
+def test_stream_interns_symbols(tmp_path):
+    csv_path = generate_synthetic_csv(tmp_path / "ticks.csv", n=10)
+    points = list(stream_market_data(csv_path))
+    assert len({id(p.symbol) for p in points}) == 1
+
+
+def test_stream_symbol_cache_is_capped(tmp_path, monkeypatch):
+    import data_loader
+
+    monkeypatch.setattr(data_loader, "_SYM_CACHE_SIZE", 2)
+    monkeypatch.setattr(data_loader, "_sym_cache", {})
+    csv_path = tmp_path / "ticks.csv"
+    rows = "".join(f"2026-01-01T09:30:00,S{i % 5},{i}\n" for i in range(20))
+    csv_path.write_text("timestamp,symbol,price\n" + rows, encoding="utf-8")
+    points = list(stream_market_data(csv_path))
+    assert [p.symbol for p in points] == [f"S{i % 5}" for i in range(20)]
+    assert len(data_loader._sym_cache) <= 2
+
+
+def test_parse_timestamp_remembers_last_format(monkeypatch):
+    import data_loader
+
+    monkeypatch.setattr(data_loader, "_last_parser", data_loader._iso)
+    parse = _parse_timestamp.__wrapped__
+    assert parse("2026/1/2 09:30:00") == datetime(2026, 1, 2, 9, 30, 0)
+    assert data_loader._last_parser is data_loader._PARSERS[2]
+    # A different format still parses, and becomes the new first choice.
+    assert parse("2026-01-02T09:30:00+01:00").utcoffset().total_seconds() == 3600
+    assert data_loader._last_parser is data_loader._iso
+
+
+def test_stream_fast_io_matches_default(tmp_path):
+    csv_path = generate_synthetic_csv(tmp_path / "ticks.csv", n=50)
+    assert list(stream_market_data(csv_path, fast_io=True)) == list(stream_market_data(csv_path))
+
+
+def test_df_loader_keeps_baseline_timestamp_contract(tmp_path):
+    csv_path = tmp_path / "ticks.csv"
+    csv_path.write_text(
+        "timestamp,symbol,price\n2026-01-01T09:30:00+01:00,ABC,1\n2026-01-01T09:31:00+02:00,ABC,2\n",
+        encoding="utf-8",
+    )
+    assert load_market_data(csv_path) == list(stream_market_data(csv_path))
+
+    csv_path.write_text("timestamp,symbol,price\n01/02/2026 09:30,ABC,1\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="Unsupported timestamp format"):
+        load_market_data(csv_path)
+
+    csv_path.write_text("", encoding="utf-8")
+    with pytest.raises(ValueError, match="CSV must contain columns"):
+        load_market_data(csv_path)
+
+
+def test_parse_timestamp_fast_path_checks_separators():
+    parse = _parse_timestamp.__wrapped__
+    for raw in ("2026x01x01 09:30:00", "2026-01-01 09-30-00", "2026-+1-01 09:30:00", "2026-01/01 09:30:00"):
+        with pytest.raises(ValueError):
+            parse(raw)
+
+
+def test_arrays_keep_utc_offsets(tmp_path):
+    csv_path = tmp_path / "ticks.csv"
+    for second_offset in ("+01:00", "+02:00"):
+        csv_path.write_text(
+            f"timestamp,symbol,price\n2026-01-01T09:30:00+01:00,ABC,1\n2026-01-01T09:31:00{second_offset},ABC,2\n",
+            encoding="utf-8",
+        )
+        arrays = load_market_data_arrays(csv_path)
+        points = load_market_data(csv_path)
+        assert list(arrays) == points
+        assert arrays[0] == points[0]
+        assert [p.timestamp.utcoffset() for p in arrays] == [p.timestamp.utcoffset() for p in points]
+        assert points[0].timestamp.hour == 9
+
+
+def test_synthetic_csv_timestamps_match_isoformat(tmp_path):
+    from datetime import timedelta, timezone
+
+    for start in (
+        datetime(2026, 1, 1, 9, 30, 0),
+        datetime(2026, 1, 1, 9, 30, 0, 250000),
+        datetime(2026, 1, 1, 9, 30, 0, tzinfo=timezone.utc),
+        datetime(2026, 1, 1, 9, 30, 0, 5, tzinfo=timezone(timedelta(hours=-5))),
+    ):
+        csv_path = generate_synthetic_csv(tmp_path / "ticks.csv", n=3, start=start)
+        rows = csv_path.read_text(encoding="utf-8").splitlines()[1:]
+        assert [r.split(",")[0] for r in rows] == [(start + timedelta(minutes=i)).isoformat() for i in range(3)]
+
+
+def test_df_loader_does_not_treat_na_strings_as_missing(tmp_path):
+    csv_path = tmp_path / "ticks.csv"
+    csv_path.write_text(
+        "timestamp,symbol,price\n2026-01-01T09:30:00,NA,1\n2026-01-01T09:31:00,null,2\n2026-01-01T09:32:00,,3\n",
+        encoding="utf-8",
+    )
+    assert [p.symbol for p in load_market_data(csv_path)] == ["NA", "null", ""]
+    assert [p.symbol for p in load_market_data_arrays(csv_path)] == ["NA", "null", ""]
+
+
+def test_df_loader_rejects_empty_timestamp(tmp_path):
+    csv_path = tmp_path / "ticks.csv"
+    csv_path.write_text("timestamp,symbol,price\n,ABC,1\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="Unsupported timestamp format"):
+        load_market_data(csv_path)
+
+
+def test_df_loader_rejects_empty_price(tmp_path):
+    csv_path = tmp_path / "ticks.csv"
+    csv_path.write_text("timestamp,symbol,price\n2026-01-01T09:30:00,ABC,\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_market_data(csv_path)
+
+
+def test_frame_to_arrays_rejects_missing_symbols():
+    import pandas as pd
+
+    from data_loader import frame_to_arrays
+
+    df = pd.DataFrame({
+        "timestamp": pd.to_datetime(["2026-01-01T09:30:00", "2026-01-01T09:31:00"]),
+        "symbol": pd.Categorical([None, "ZZZ"]),
+        "price": [1.0, 2.0],
+    })
+    with pytest.raises(ValueError, match="missing"):
+        frame_to_arrays(df)
@@ -4,7 +4,7 @@ from datetime import datetime, timedelta
 import pytest
 
 from models import MarketDataPoint
-from profiler import run_strategy
+from profiler import run_strategy, time_and_optionally_trace
 from strategies import OptimizedNaiveMovingAverageStrategy, WindowedMovingAverageStrategy
 
 
@@ -39,3 +39,23 @@ def test_windowed_fast_enough_100k():
     run_strategy(strat, ticks)
     dt = time.perf_counter() - t0
     assert dt < 1.0
+
+
+def test_cprofile_rides_on_a_timed_repeat(tmp_path):
+    ticks = _ticks(1_000)
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return WindowedMovingAverageStrategy(window_size=10)
+
+    out = tmp_path / "profile.txt"
+    secs, peak_mb = time_and_optionally_trace(factory, ticks, repeats=3, cprofile_path=out)
+    assert secs is not None and peak_mb is not None
+    assert len(calls) == 3 + 1
+    assert "generate_signals" in out.read_text(encoding="utf-8")
+
+    # A single repeat still gets one clean timed run before the profiled one.
+    calls.clear()
+    time_and_optionally_trace(factory, ticks, repeats=1, cprofile_path=out)
+    assert len(calls) == 1 + 1 + 1
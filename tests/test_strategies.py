@@ -1,6 +1,10 @@
 from datetime import datetime, timedelta
 
-from models import MarketDataPoint
+import numpy as np
+import pytest
+
+from models import MarketDataArrays, MarketDataPoint
+from profiler import run_strategy
 from strategies import NaiveMovingAverageStrategy, WindowedMovingAverageStrategy, OptimizedNaiveMovingAverageStrategy
 
 
@@ -23,6 +27,24 @@ def test_naive_matches_optimized_cumulative_average_signals():
     assert sigs1 == sigs2
 
 
+def test_naive_matches_optimized_on_flat_prices():
+    # 0.1 is inexact in binary, so the average only equals the price if both sum in the same order.
+    ticks = _ticks([0.1] * 5000)
+    s1 = NaiveMovingAverageStrategy()
+    s2 = OptimizedNaiveMovingAverageStrategy()
+
+    sigs1 = [s1.generate_signals(t) for t in ticks]
+    sigs2 = [s2.generate_signals(t) for t in ticks]
+    assert sigs1 == sigs2
+
+    expected, total = [], 0.0
+    for i, t in enumerate(ticks, start=1):
+        total += t.price
+        avg = total / i
+        expected.append(["BUY"] if t.price > avg else ["SELL"] if t.price < avg else [])
+    assert sigs1 == expected
+
+
 def test_windowed_strategy_emits_expected_signals():
     ticks = _ticks([10, 12, 14, 10, 9, 11])
     strat = WindowedMovingAverageStrategy(window_size=3)
@@ -39,3 +61,102 @@ def test_windowed_memory_bound_by_k():
     for t in ticks:
         strat.generate_signals(t)
     assert len(strat.window_by_symbol["ABC"]) <= 5
+
+
+def _mixed_arrays():
+    prices = [10, 20, 11, 19, 9, 21, 10, 20, 12, 18, 12, 22, 8]
+    symbols = ["ABC", "XYZ"] * 6 + ["ABC"]
+    t0 = datetime(2026, 1, 1, 9, 30, 0)
+    ticks = [MarketDataPoint(timestamp=t0 + timedelta(minutes=i), symbol=s, price=float(p))
+             for i, (s, p) in enumerate(zip(symbols, prices))]
+    arrays = MarketDataArrays(
+        timestamps=np.array([t.timestamp for t in ticks], dtype="datetime64[ns]"),
+        symbol_codes=np.array([0 if s == "ABC" else 1 for s in symbols], dtype=np.int8),
+        symbols=np.array(["ABC", "XYZ"], dtype=object),
+        prices=np.array(prices, dtype=np.float64),
+    )
+    return ticks, arrays
+
+
+def _as_codes(signals):
+    return [{"BUY": 1, "SELL": -1}[s[0]] if s else 0 for s in signals]
+
+
+def test_optimized_batch_matches_per_tick():
+    ticks, arrays = _mixed_arrays()
+    strat = OptimizedNaiveMovingAverageStrategy()
+    streamed = _as_codes(strat.generate_signals(t) for t in ticks)
+    batch = OptimizedNaiveMovingAverageStrategy().generate_signals_batch(arrays.symbol_codes, arrays.prices)
+    assert batch.dtype == np.int8
+    assert batch.tolist() == streamed
+
+
+def test_run_strategy_accepts_arrays():
+    ticks, arrays = _mixed_arrays()
+    assert list(arrays) == ticks
+    assert len(arrays[:5]) == 5
+    for factory in (NaiveMovingAverageStrategy, OptimizedNaiveMovingAverageStrategy):
+        assert run_strategy(factory(), arrays) == run_strategy(factory(), ticks)
+
+
+def test_optimized_batch_single_symbol_matches_per_tick():
+    ticks = _ticks([10, 11, 9, 10, 12, 12, 8])
+    strat = OptimizedNaiveMovingAverageStrategy()
+    streamed = _as_codes(strat.generate_signals(t) for t in ticks)
+    prices = np.array([t.price for t in ticks])
+    batch = OptimizedNaiveMovingAverageStrategy().generate_signals_batch(np.zeros(len(prices), dtype=np.int8), prices)
+    assert batch.tolist() == streamed
+
+
+def test_windowed_batch_matches_per_tick():
+    ticks, arrays = _mixed_arrays()
+    strat = WindowedMovingAverageStrategy(window_size=3)
+    streamed = _as_codes(strat.generate_signals(t) for t in ticks)
+    batch = WindowedMovingAverageStrategy(window_size=3).generate_signals_batch(arrays.symbol_codes, arrays.prices)
+    assert batch.tolist() == streamed
+
+    single = [t for t in ticks if t.symbol == "ABC"]
+    strat = WindowedMovingAverageStrategy(window_size=3)
+    streamed = _as_codes(strat.generate_signals(t) for t in single)
+    prices = np.array([t.price for t in single])
+    batch = WindowedMovingAverageStrategy(window_size=3).generate_signals_batch(np.zeros(len(prices), np.int8), prices)
+    assert batch.tolist() == streamed
+
+
+def test_symbol_cache_keeps_interleaved_state_separate():
+    ticks, _ = _mixed_arrays()
+    for factory in (NaiveMovingAverageStrategy, WindowedMovingAverageStrategy, OptimizedNaiveMovingAverageStrategy):
+        interleaved = factory()
+        separate = {"ABC": factory(), "XYZ": factory()}
+        for t in ticks:
+            assert interleaved.generate_signals(t) == separate[t.symbol].generate_signals(t)
+    strat = OptimizedNaiveMovingAverageStrategy()
+    for t in ticks:
+        strat.generate_signals(t)
+    assert strat.count_by_symbol == {"ABC": 7, "XYZ": 6}
+
+
+def test_batch_paths_agree_without_c_extension(monkeypatch):
+    import strategies
+
+    pytest.importorskip("_fastmovavg")
+    assert strategies._fastmovavg is not None
+    prices = np.array([10, 12, 14, 10, 9, 11, 11, 8, 15], dtype=np.float64)
+    codes = np.zeros(len(prices), dtype=np.int8)
+    for factory in (lambda: WindowedMovingAverageStrategy(window_size=3), OptimizedNaiveMovingAverageStrategy):
+        with_ext = factory().generate_signals_batch(codes, prices)
+        monkeypatch.setattr(strategies, "_fastmovavg", None)
+        without_ext = factory().generate_signals_batch(codes, prices)
+        monkeypatch.undo()
+        assert with_ext.tolist() == without_ext.tolist()
+
+
+def test_windowed_reenters_full_window_after_partial_one():
+    # A's window is full when B (still filling) interrupts it; A's state must not pick up B's.
+    ticks = _ticks([1, 2, 3]) + _ticks([5], symbol="B") + _ticks([4, 5, 6])
+    interleaved = WindowedMovingAverageStrategy(window_size=2)
+    separate = {"ABC": WindowedMovingAverageStrategy(window_size=2), "B": WindowedMovingAverageStrategy(window_size=2)}
+    for t in ticks:
+        assert interleaved.generate_signals(t) == separate[t.symbol].generate_signals(t)
+    assert interleaved.sum_by_symbol["ABC"] == 11.0
+    assert list(interleaved.window_by_symbol["ABC"]) == [5.0, 6.0]